@@ -323,7 +323,8 @@ class Globals:
         import guppylang.std.builtins
         from guppylang.defs import GuppyDefinition
 
-        return BUILTIN_DEFS | {
+        # `dict()` since `BUILTIN_DEFS` is a read-only mapping without `|` support
+        return dict(BUILTIN_DEFS) | {
             name: val.wrapped
             for name, val in guppylang.std.builtins.__dict__.items()
             if isinstance(val, GuppyDefinition)
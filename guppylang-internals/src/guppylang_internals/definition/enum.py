@@ -1,5 +1,6 @@
 import ast
 import keyword
+import sys
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import ClassVar, Generic, TypeVar
@@ -34,7 +35,9 @@ from guppylang_internals.definition.util import (
     UncheckedField,
     check_not_recursive,
     extract_generic_params,
+    parse_field_type,
     parse_py_class,
+    starts_with_docstring,
 )
 from guppylang_internals.diagnostic import Error, Help
 from guppylang_internals.engine import DEF_STORE
@@ -43,7 +46,7 @@ from guppylang_internals.span import SourceMap
 from guppylang_internals.tys import Effect
 from guppylang_internals.tys.arg import Argument
 from guppylang_internals.tys.param import Parameter, check_all_args
-from guppylang_internals.tys.parsing import TypeParsingCtx, type_from_ast
+from guppylang_internals.tys.parsing import TypeParsingCtx
 from guppylang_internals.tys.subst import Instantiator
 from guppylang_internals.tys.ty import (
     EnumType,
@@ -75,7 +78,7 @@ class VariantFormHint(Help):
 F = TypeVar("F", UncheckedField, CheckedField)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnumVariant(Generic[F]):
     index: int
     name: str
@@ -91,6 +94,10 @@ class RawEnumDef(TypeDef, ParsableDef, UserProvidedLinkName):
 
     def parse(self, globals: "Globals", sources: SourceMap) -> "ParsedEnumDef":
         """Parses the raw class object into an AST and checks that it is well-formed."""
+        # Deferred import to avoid a circular dependency at module load; hoisted out
+        # of the loop over methods below so it only runs once per parse.
+        from guppylang.defs import GuppyDefinition
+
         frame = DEF_STORE.frames[self.id]
         cls_def = parse_py_class(self.python_class, frame, sources)
         if cls_def.keywords:
@@ -103,30 +110,28 @@ class RawEnumDef(TypeDef, ParsableDef, UserProvidedLinkName):
         variants: dict[str, EnumVariant[UncheckedField]] = {}
         used_func_names: dict[str, ast.FunctionDef] = {}
         variant_index = 0
-        for i, node in enumerate(cls_def.body):
-            match i, node:
+        body = cls_def.body
+        # Docstrings are fine if they occur at the start, so we skip over a leading one
+        # instead of special-casing the first index inside the match below
+        start = 1 if starts_with_docstring(body) else 0
+        for node in body[start:]:
+            match node:
                 # TODO: do we allow `pass` statements to define empty enum?
-                case _, ast.Pass():
-                    pass
-                # Docstrings are also fine if they occur at the start
-                case 0, ast.Expr(value=ast.Constant(value=v)) if isinstance(v, str):
+                case ast.Pass():
                     pass
-                case _, ast.FunctionDef(name=name) as node:
+                case ast.FunctionDef(name=name):
                     used_func_names[name] = node
                 # Enum variants are declared via a dictionary, where keys are the
                 # variant fields and values are types:
                 # e.g. `variant = {"a": int, ...}
 
                 # Multi-target assignments like `a = b = {...}` are not supported
-                case _, ast.Assign(targets=[_, _, *_]) as node:
+                case ast.Assign(targets=[_, _, *_]):
                     raise GuppyError(UnsupportedError(node, "Multi assignments"))
                 # Inline tuple unpacking: `v1, v2 = {}, {}`
-                case (
-                    _,
-                    ast.Assign(
-                        targets=[ast.Tuple(elts=target_names)],
-                        value=ast.Tuple(elts=dict_values),
-                    ) as node,
+                case ast.Assign(
+                    targets=[ast.Tuple(elts=target_names)],
+                    value=ast.Tuple(elts=dict_values),
                 ) if len(target_names) == len(dict_values) and all(
                     isinstance(t, ast.Name) and isinstance(v, ast.Dict)
                     for t, v in zip(target_names, dict_values, strict=True)
@@ -136,7 +141,7 @@ class RawEnumDef(TypeDef, ParsableDef, UserProvidedLinkName):
                     ):
                         assert isinstance(target_name_node, ast.Name)  # for mypy
                         assert isinstance(dict_node, ast.Dict)  # for mypy
-                        variant_name = target_name_node.id
+                        variant_name = sys.intern(target_name_node.id)
                         if variant_name in variants:
                             raise GuppyError(
                                 DuplicateVariantError(
@@ -147,12 +152,8 @@ class RawEnumDef(TypeDef, ParsableDef, UserProvidedLinkName):
                             variant_index, variant_name, dict_node
                         )
                         variant_index += 1
-                case (
-                    _,
-                    ast.Assign(
-                        targets=[ast.Name(id=variant_name)], value=ast.Dict()
-                    ) as node,
-                ):
+                case ast.Assign(targets=[ast.Name(id=variant_name)], value=ast.Dict()):
+                    variant_name = sys.intern(variant_name)
                     if variant_name in variants:
                         raise GuppyError(
                             DuplicateVariantError(
@@ -165,7 +166,7 @@ class RawEnumDef(TypeDef, ParsableDef, UserProvidedLinkName):
                     )
                     variant_index += 1
                 # If unexpected statements are found
-                case _, node:
+                case _:
                     err = UnexpectedError(
                         node,
                         "statement",
@@ -177,8 +178,6 @@ class RawEnumDef(TypeDef, ParsableDef, UserProvidedLinkName):
         # Ensure that functions do not override enum variants
         # and that all functions are Guppy functions
         for func_name, func_def in used_func_names.items():
-            from guppylang.defs import GuppyDefinition
-
             if func_name in variants:
                 raise GuppyError(
                     DuplicateVariantError(
@@ -217,25 +216,38 @@ class ParsedEnumDef(TypeDef, CheckableDef):
     variants: Mapping[str, EnumVariant[UncheckedField]]
     link_name_prefix: str
 
+    #: Memoized result of `check`. Parsed definitions are recreated whenever the
+    #: compilation cache is reset, so caching on the instance is safe.
+    _checked: "CheckedEnumDef | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def check(self, globals: Globals) -> "CheckedEnumDef":
         """Checks that all enum fields have valid types."""
+        if self._checked is not None:
+            return self._checked
         param_var_mapping = {p.name: p for p in self.params}
         ctx = TypeParsingCtx(globals, param_var_mapping)
 
         check_not_recursive(self, ctx)
 
         checked_variants: dict[str, EnumVariant[CheckedField]] = {}
+        type_cache: dict[str, Type] = {}
         # loop over variants to check their fields
         for name, variant in self.variants.items():
-            fields: list[CheckedField] = [
-                CheckedField(field.name, type_from_ast(field.type_ast, ctx))
+            fields = tuple(
+                CheckedField(
+                    field.name, parse_field_type(field.type_ast, ctx, type_cache)
+                )
                 for field in variant.fields
-            ]
+            )
             checked_variants[name] = EnumVariant(variant.index, name, fields)
 
-        return CheckedEnumDef(
+        checked = CheckedEnumDef(
             self.id, self.name, self.defined_at, self.params, checked_variants
         )
+        object.__setattr__(self, "_checked", checked)
+        return checked
 
     def check_instantiate(
         self, args: Sequence[Argument], loc: AstNode | None = None
@@ -293,19 +305,16 @@ class CheckedEnumDef(TypeDef, CompiledDef):
                 )
 
         variants_constructors = []
+        owned, no_flags = InputFlags.Owned, InputFlags.NoFlags
+        enum_type = EnumType(
+            defn=self, args=[p.to_bound(i) for i, p in enumerate(self.params)]
+        )
         for variant_name, variant in self.variants.items():
-            enum_type = EnumType(
-                defn=self, args=[p.to_bound(i) for i, p in enumerate(self.params)]
-            )
             constructor_sig = FunctionType(
-                inputs=[
-                    FuncInput(
-                        f.ty,
-                        InputFlags.Owned if f.ty.linear else InputFlags.NoFlags,
-                        f.name,
-                    )
+                inputs=tuple(
+                    FuncInput(f.ty, owned if f.ty.linear else no_flags, f.name)
                     for f in variant.fields
-                ],
+                ),
                 output=enum_type,
                 params=self.params,
             )
@@ -332,9 +341,11 @@ def parse_enum_variant(
     index: int, name: str, dict_ast: ast.Dict
 ) -> EnumVariant[UncheckedField]:
     variant_fields: list[UncheckedField] = []
-    variant_field_names = []
-    # we parse the enum variant to get the enum variant fields
-    for k, v in zip(dict_ast.keys, dict_ast.values, strict=True):
+    variant_field_names: set[str] = set()
+    # we parse the enum variant to get the enum variant fields. The parser guarantees
+    # that a dict literal has as many keys as values, so we can skip the strict
+    # length bookkeeping on every iteration.
+    for k, v in zip(dict_ast.keys, dict_ast.values, strict=False):
         match k:
             case ast.Constant(value=str(key_name)):
                 # check validity of field name
@@ -352,7 +363,10 @@ def parse_enum_variant(
                             k, name, key_name, class_type="enum variant"
                         )
                     )
-                variant_field_names.append(key_name)
+                # Interned names turn the repeated comparisons during variant
+                # checking into pointer comparisons
+                key_name = sys.intern(key_name)
+                variant_field_names.add(key_name)
                 variant_fields.append(UncheckedField(key_name, v))
             case _:
                 err = UnexpectedError(
@@ -363,4 +377,4 @@ def parse_enum_variant(
                 err.add_sub_diagnostic(VariantFormHint(None))
                 raise GuppyError(err)
 
-    return EnumVariant(index, name, variant_fields)
+    return EnumVariant(index, name, tuple(variant_fields))
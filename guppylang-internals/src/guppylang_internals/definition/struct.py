@@ -1,4 +1,5 @@
 import ast
+import sys
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import ClassVar
@@ -35,7 +36,9 @@ from guppylang_internals.definition.util import (
     UncheckedField,
     check_not_recursive,
     extract_generic_params,
+    parse_field_type,
     parse_py_class,
+    starts_with_docstring,
 )
 from guppylang_internals.diagnostic import Error, Help
 from guppylang_internals.engine import DEF_STORE
@@ -44,7 +47,7 @@ from guppylang_internals.span import SourceMap
 from guppylang_internals.tys import Effect
 from guppylang_internals.tys.arg import Argument
 from guppylang_internals.tys.param import Parameter, check_all_args
-from guppylang_internals.tys.parsing import TypeParsingCtx, type_from_ast
+from guppylang_internals.tys.parsing import TypeParsingCtx
 from guppylang_internals.tys.ty import (
     FuncInput,
     FunctionType,
@@ -73,6 +76,10 @@ class RawStructDef(TypeDef, ParsableDef, UserProvidedLinkName):
 
     def parse(self, globals: Globals, sources: SourceMap) -> "ParsedStructDef":
         """Parses the raw class object into an AST and checks that it is well-formed."""
+        # Deferred import to avoid a circular dependency at module load; hoisted out
+        # of the class-body loop below so it only runs once per parse.
+        from guppylang.defs import GuppyDefinition
+
         frame = DEF_STORE.frames[self.id]
         cls_def = parse_py_class(self.python_class, frame, sources)
         if cls_def.keywords:
@@ -81,20 +88,21 @@ class RawStructDef(TypeDef, ParsableDef, UserProvidedLinkName):
         params = extract_generic_params(cls_def, self.name, globals, "Struct")
 
         fields: list[UncheckedField] = []
-        used_field_names: set[str] = set()
-        used_func_names: dict[str, ast.FunctionDef] = {}
-        for i, node in enumerate(cls_def.body):
-            match i, node:
+        # All field and method names seen so far, mapped to whether the name belongs
+        # to a field and the node that defined it. A single dict probe covers both
+        # duplicate detection and the field/method override check.
+        defined: dict[str, tuple[bool, ast.stmt]] = {}
+        body = cls_def.body
+        # Docstrings are fine if they occur at the start, so we skip over a leading one
+        # instead of special-casing the first index inside the match below
+        start = 1 if starts_with_docstring(body) else 0
+        for node in body[start:]:
+            match node:
                 # We allow `pass` statements to define empty structs
-                case _, ast.Pass():
-                    pass
-                # Docstrings are also fine if they occur at the start
-                case 0, ast.Expr(value=ast.Constant(value=v)) if isinstance(v, str):
+                case ast.Pass():
                     pass
                 # Ensure that all function definitions are Guppy functions
-                case _, ast.FunctionDef(name=name) as node:
-                    from guppylang.defs import GuppyDefinition
-
+                case ast.FunctionDef(name=name):
                     v = getattr(self.python_class, name)
                     if not isinstance(v, GuppyDefinition):
                         raise GuppyError(
@@ -102,26 +110,44 @@ class RawStructDef(TypeDef, ParsableDef, UserProvidedLinkName):
                                 node, self.name, name, "struct", "@guppy"
                             )
                         )
-                    used_func_names[name] = node
-                    if name in used_field_names:
+                    prev = defined.get(name)
+                    if prev is not None and prev[0]:
                         raise GuppyError(
                             DuplicateFieldError(node, self.name, name, "struct")
                         )
+                    defined[name] = (False, node)
                 # Struct fields are declared via annotated assignments without value
-                case _, ast.AnnAssign(target=ast.Name(id=field_name)) as node:
-                    if node.value:
+                case ast.AnnAssign(
+                    target=ast.Name(id=field_name) as target,
+                    annotation=annotation,
+                    value=value,
+                ):
+                    if value:
                         raise GuppyError(
-                            UnsupportedError(node.value, "Default struct values")
+                            UnsupportedError(value, "Default struct values")
                         )
-                    if field_name in used_field_names:
-                        raise GuppyError(
-                            DuplicateFieldError(
-                                node.target, self.name, field_name, "struct"
+                    match defined.get(field_name):
+                        case (True, _):
+                            raise GuppyError(
+                                DuplicateFieldError(
+                                    target, self.name, field_name, "struct"
+                                )
                             )
-                        )
-                    fields.append(UncheckedField(field_name, node.annotation))
-                    used_field_names.add(field_name)
-                case _, node:
+                        # Fields are not allowed to override methods. We point at
+                        # the method definition, like the dedicated post-loop check
+                        # used to.
+                        case (False, func_node):
+                            raise GuppyError(
+                                DuplicateFieldError(
+                                    func_node, self.name, field_name, "struct"
+                                )
+                            )
+                    # Interned names turn the repeated comparisons during field
+                    # access checking into pointer comparisons
+                    field_name = sys.intern(field_name)
+                    fields.append(UncheckedField(field_name, annotation))
+                    defined[field_name] = (True, node)
+                case _:
                     err = UnexpectedError(
                         node,
                         "statement",
@@ -130,20 +156,19 @@ class RawStructDef(TypeDef, ParsableDef, UserProvidedLinkName):
                     err.add_sub_diagnostic(FieldFormHint(None))
                     raise GuppyError(err)
 
-        # Ensure that functions don't override struct fields
-        if overridden := used_field_names.intersection(used_func_names.keys()):
-            x = overridden.pop()
-            raise GuppyError(
-                DuplicateFieldError(used_func_names[x], self.name, x, "struct")
-            )
-
         link_name_prefix = (
             self._user_set_link_name
             or f"{self.python_class.__module__}.{self.python_class.__qualname__}"
         )
 
         return ParsedStructDef(
-            self.id, self.name, cls_def, params, fields, self.frozen, link_name_prefix
+            self.id,
+            self.name,
+            cls_def,
+            params,
+            tuple(fields),
+            self.frozen,
+            link_name_prefix,
         )
 
     def check_instantiate(
@@ -162,8 +187,16 @@ class ParsedStructDef(TypeDef, CheckableDef):
     frozen: bool
     link_name_prefix: str
 
+    #: Memoized result of `check`. Parsed definitions are recreated whenever the
+    #: compilation cache is reset, so caching on the instance is safe.
+    _checked: "CheckedStructDef | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def check(self, globals: Globals) -> "CheckedStructDef":
         """Checks that all struct fields have valid types."""
+        if self._checked is not None:
+            return self._checked
         param_var_mapping = {p.name: p for p in self.params}
         ctx = TypeParsingCtx(globals, param_var_mapping, disallow_protocol_types=True)
 
@@ -171,12 +204,16 @@ class ParsedStructDef(TypeDef, CheckableDef):
         # otherwise the code below would not terminate.
         check_not_recursive(self, ctx)
 
-        fields = [
-            CheckedField(f.name, type_from_ast(f.type_ast, ctx)) for f in self.fields
-        ]
-        return CheckedStructDef(
+        type_cache: dict[str, Type] = {}
+        fields = tuple(
+            CheckedField(f.name, parse_field_type(f.type_ast, ctx, type_cache))
+            for f in self.fields
+        )
+        checked = CheckedStructDef(
             self.id, self.name, self.defined_at, self.params, fields, self.frozen
         )
+        object.__setattr__(self, "_checked", checked)
+        return checked
 
     def check_instantiate(
         self, args: Sequence[Argument], loc: AstNode | None = None
@@ -195,6 +232,13 @@ class ParsedStructDef(TypeDef, CheckableDef):
         return StructType(args, checked_def)
 
 
+class ConstructorCompiler(CustomCallCompiler):
+    """Compiler for the `__new__` constructor method of a struct."""
+
+    def compile(self, args: list[Wire]) -> list[Wire]:
+        return list(self.builder.add_op(make_tuple(), *args))
+
+
 @dataclass(frozen=True)
 class CheckedStructDef(TypeDef, CompiledDef):
     """A struct definition that has been fully checked."""
@@ -213,22 +257,12 @@ class CheckedStructDef(TypeDef, CompiledDef):
 
     def generated_methods(self) -> list[CustomFunctionDef]:
         """Auto-generated methods for this struct."""
-
-        class ConstructorCompiler(CustomCallCompiler):
-            """Compiler for the `__new__` constructor method of a struct."""
-
-            def compile(self, args: list[Wire]) -> list[Wire]:
-                return list(self.builder.add_op(make_tuple(), *args))
-
+        owned, no_flags = InputFlags.Owned, InputFlags.NoFlags
         constructor_sig = FunctionType(
-            inputs=[
-                FuncInput(
-                    f.ty,
-                    InputFlags.Owned if f.ty.linear else InputFlags.NoFlags,
-                    f.name,
-                )
+            inputs=tuple(
+                FuncInput(f.ty, owned if f.ty.linear else no_flags, f.name)
                 for f in self.fields
-            ],
+            ),
             output=StructType(
                 defn=self, args=[p.to_bound(i) for i, p in enumerate(self.params)]
             ),
@@ -256,6 +290,10 @@ def try_parse_generic_base(node: ast.expr, base_name: str) -> list[ast.expr] | N
 
     Returns the generic parameters or `None` if the AST has a different shape
     """
+    # Most base-class nodes are not subscripts at all, so skip the full
+    # destructuring match for them
+    if not isinstance(node, ast.Subscript):
+        return None
     match node:
         case ast.Subscript(value=ast.Name(id=name), slice=elem) if base_name == name:
             return elem.elts if isinstance(elem, ast.Tuple) else [elem]
@@ -276,16 +314,15 @@ def params_from_ast(nodes: Sequence[ast.expr], globals: Globals) -> list[Paramet
     Raises user errors if the AST nodes don't correspond to parameters or parameters
     occur multiple times.
     """
-    params: list[Parameter] = []
-    params_set: set[DefId] = set()
+    # A single insertion-ordered dict doubles as duplicate check and result list
+    params: dict[DefId, Parameter] = {}
     for node in nodes:
         if isinstance(node, ast.Name) and node.id in globals:
             defn = globals[node.id]
             if isinstance(defn, ParamDef):
-                if defn.id in params_set:
+                if defn.id in params:
                     raise GuppyError(RepeatedTypeParamError(node, node.id))
-                params.append(defn.to_param(len(params)))
-                params_set.add(defn.id)
+                params[defn.id] = defn.to_param(len(params))
                 continue
         raise GuppyError(ExpectedError(node, "a type parameter"))
-    return params
+    return list(params.values())
@@ -1,4 +1,5 @@
 import ast
+import hashlib
 import inspect
 import linecache
 from collections.abc import Iterator, Sequence
@@ -28,6 +29,7 @@ from guppylang_internals.tys.parsing import (
     annotation_nodes,
     parse_parameter,
     try_parse_defn,
+    type_from_ast,
 )
 from guppylang_internals.tys.ty import Type
 
@@ -106,7 +108,7 @@ class ProtocolHint(Help):
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UncheckedField:
     """A single field on a struct or enum variant whose type has not been checked yet."""  # noqa: E501
 
@@ -114,7 +116,7 @@ class UncheckedField:
     type_ast: ast.expr
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckedField:
     """A single field on a struct or enum variant."""
 
@@ -122,27 +124,67 @@ class CheckedField:
     ty: Type
 
 
+def parse_field_type(
+    type_ast: ast.expr, ctx: TypeParsingCtx, cache: dict[str, Type]
+) -> Type:
+    """Parses a field type annotation, reusing previously parsed types.
+
+    Fields across a struct or enum often share syntactically identical annotations
+    (e.g. `int` or `qubit`), so we only run `type_from_ast` once per distinct
+    annotation. Types are immutable, so sharing the parsed object is safe.
+    """
+    key = ast.dump(type_ast)
+    if (ty := cache.get(key)) is None:
+        cache[key] = ty = type_from_ast(type_ast, ctx)
+    return ty
+
+
+def starts_with_docstring(body: Sequence[ast.stmt]) -> bool:
+    """Checks whether a class body begins with a docstring statement."""
+    return (
+        bool(body)
+        and isinstance(first := body[0], ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    )
+
+
 def check_not_recursive(defn: ParsedRecursiveTypeDef, ctx: TypeParsingCtx) -> None:
     """Raises a user error if a struct, enum, or type alias depends on itself."""
-    _check_not_recursive(defn, ctx, [defn.id], set())
+    from guppylang_internals.engine import ENGINE
+
+    # Definitions already verified to be acyclic in the current compilation run are
+    # shared via the engine, so each definition's dependency subtree is only walked
+    # once instead of once per definition depending on it.
+    verified_acyclic = ENGINE.verified_acyclic
+    if defn.id in verified_acyclic:
+        return
+    _check_not_recursive(defn, ctx, {defn.id}, verified_acyclic)
 
 
 def _check_not_recursive(
     defn: ParsedRecursiveTypeDef,
     ctx: TypeParsingCtx,
-    path: list[DefId],
+    path: set[DefId],
     checked: set[DefId],
 ) -> None:
-    for dependency, loc in _dependencies(defn, ctx):
-        if dependency.id in path:
-            raise GuppyError(UnsupportedError(loc, "Recursive definitions"))
-        if dependency.id not in checked:
-            dependency_ctx = _type_parsing_ctx(dependency)
-            _check_not_recursive(
-                dependency, dependency_ctx, [*path, dependency.id], checked
-            )
-
-    checked.add(defn.id)
+    # Iterative DFS with an explicit stack of (definition, remaining dependencies)
+    # so that deeply nested type definitions can't blow the Python recursion limit
+    stack = [(defn, _dependencies(defn, ctx))]
+    while stack:
+        current, dependencies = stack[-1]
+        for dependency, loc in dependencies:
+            if dependency.id in path:
+                raise GuppyError(UnsupportedError(loc, "Recursive definitions"))
+            if dependency.id not in checked:
+                path.add(dependency.id)
+                dependency_ctx = _type_parsing_ctx(dependency)
+                stack.append((dependency, _dependencies(dependency, dependency_ctx)))
+                break
+        else:
+            checked.add(current.id)
+            path.discard(current.id)
+            stack.pop()
 
 
 def _dependencies(
@@ -197,6 +239,13 @@ def _is_parsed_recursive_type_def(
     return isinstance(defn, ParsedStructDef | ParsedEnumDef | ParsedTypeAliasDef)
 
 
+#: Cache of parsed class ASTs, keyed by source file, first line number, and a digest of
+#: the source itself. Parsing is by far the dominant cost when a class is re-parsed
+#: across repeated compilations (e.g. REPL iterations), so we keep the parsed AST
+#: around for as long as the source is unchanged.
+_class_ast_cache: dict[tuple[str, int, bytes], ast.ClassDef] = {}
+
+
 def parse_py_class(
     cls: type, defining_frame: FrameType, sources: SourceMap
 ) -> ast.ClassDef:
@@ -226,6 +275,16 @@ def parse_py_class(
     file_lines = linecache.getlines(file)
     line_offset = cls.__firstlineno__  # type: ignore[attr-defined]
     source_lines = inspect.getblock(file_lines[line_offset - 1 :])
+
+    # Re-parsing the same unchanged class is common (e.g. repeated compilations in a
+    # REPL session), so we cache the annotated AST keyed on the source digest. Cache
+    # hits may share AST nodes since we only ever read them after parsing.
+    source = "".join(source_lines)
+    cache_key = (file, line_offset, hashlib.sha256(source.encode()).digest())
+    if (cached := _class_ast_cache.get(cache_key)) is not None:
+        sources.add_file(file)
+        return cached
+
     source, cls_ast, line_offset = parse_source(source_lines, line_offset)
 
     # Store the source file in our cache
@@ -233,6 +292,7 @@ def parse_py_class(
     annotate_location(cls_ast, source, file, line_offset)
     if not isinstance(cls_ast, ast.ClassDef):
         raise GuppyError(ExpectedError(cls_ast, "a class definition"))
+    _class_ast_cache[cache_key] = cls_ast
     return cls_ast
 
 
@@ -241,6 +301,10 @@ def try_parse_generic_base(node: ast.expr, base_name: str) -> list[ast.expr] | N
 
     Returns the generic parameters or `None` if the AST has a different shape
     """
+    # Most base-class nodes are not subscripts at all, so skip the full
+    # destructuring match for them
+    if not isinstance(node, ast.Subscript):
+        return None
     match node:
         case ast.Subscript(value=ast.Name(id=name), slice=elem) if base_name == name:
             return elem.elts if isinstance(elem, ast.Tuple) else [elem]
@@ -252,6 +316,10 @@ def extract_generic_params(
     cls_def: ast.ClassDef, class_name: str, globals: Globals, class_kind: str
 ) -> list[Parameter]:
     """Extracts generic parameters from a class definition."""
+    # Fast path for the common case of a plain, non-generic class
+    if not cls_def.type_params and not cls_def.bases:
+        return []
+
     params: list[Parameter] = []
     params_span: Span | None = None
 
@@ -305,16 +373,15 @@ def params_from_ast(nodes: Sequence[ast.expr], globals: Globals) -> list[Paramet
     Raises user errors if the AST nodes don't correspond to parameters or parameters
     occur multiple times.
     """
-    params: list[Parameter] = []
-    params_set: set[DefId] = set()
+    # A single insertion-ordered dict doubles as duplicate check and result list
+    params: dict[DefId, Parameter] = {}
     for node in nodes:
         if isinstance(node, ast.Name) and node.id in globals:
             defn = globals[node.id]
             if isinstance(defn, ParamDef):
-                if defn.id in params_set:
+                if defn.id in params:
                     raise GuppyError(RepeatedTypeParamError(node, node.id))
-                params.append(defn.to_param(len(params)))
-                params_set.add(defn.id)
+                params[defn.id] = defn.to_param(len(params))
                 continue
         raise GuppyError(ExpectedError(node, "a type parameter"))
-    return params
+    return list(params.values())
@@ -1,9 +1,9 @@
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
-from types import FrameType
+from types import FrameType, MappingProxyType
 from typing import ClassVar, cast
 
 import hugr
@@ -108,7 +108,10 @@ BUILTIN_DEFS_LIST: list[RawDef] = [
     callable_protocol_def,
 ]
 
-BUILTIN_DEFS = {defn.name: defn for defn in BUILTIN_DEFS_LIST}
+# Read-only view so the builtin table cannot be mutated by accident
+BUILTIN_DEFS: Mapping[str, RawDef] = MappingProxyType(
+    {defn.name: defn for defn in BUILTIN_DEFS_LIST}
+)
 
 
 #: Identifier for a monomorphized version of a definition.
@@ -203,6 +206,12 @@ class CompilationEngine:
     compiled: dict[MonoDefId, CompiledDef]
     additional_extensions: list[Extension]
 
+    #: Definitions that have already been verified to be acyclic by
+    #: `check_not_recursive` in the current compilation run. Sharing this set ensures
+    #: that each definition's dependency subtree is only walked once, instead of once
+    #: per definition depending on it.
+    verified_acyclic: set[DefId]
+
     types_to_check_worklist: dict[DefId, ParsedDef]
     #: Generic functions
     generic_to_check_worklist: dict[DefId, CheckableGenericDef]
@@ -212,6 +221,7 @@ class CompilationEngine:
 
     # Cached compilation infrastructure (lazy-initialized, program-independent)
     _base_resolve_registry: ExtensionRegistry | None = None
+    _std_extension_names: frozenset[str] | None = None
 
     def __init__(self) -> None:
         """Resets the compilation cache."""
@@ -240,6 +250,19 @@ class CompilationEngine:
             CompilationEngine._base_resolve_registry = registry
         return CompilationEngine._base_resolve_registry
 
+    @staticmethod
+    def _get_std_extension_names() -> frozenset[str]:
+        """Get the names of the standard hugr extensions.
+
+        Cached at class level since `hugr.std._std_extensions()` rebuilds the whole
+        registry on every call.
+        """
+        if CompilationEngine._std_extension_names is None:
+            CompilationEngine._std_extension_names = frozenset(
+                ext.name for ext in hugr.std._std_extensions().extensions
+            )
+        return CompilationEngine._std_extension_names
+
     def reset(self) -> None:
         """Resets the compilation cache."""
         self.parsed = {}
@@ -248,6 +271,7 @@ class CompilationEngine:
         self.to_check_worklist = {}
         self.generic_to_check_worklist = {}
         self.types_to_check_worklist = {}
+        self.verified_acyclic = set()
 
     @pretty_errors
     def get_parsed(self, id: DefId) -> ParsedDef:
@@ -258,8 +282,8 @@ class CompilationEngine:
         """
         from guppylang_internals.checker.core import Globals
 
-        if id in self.parsed:
-            return self.parsed[id]
+        if (parsed := self.parsed.get(id)) is not None:
+            return parsed
         defn = DEF_STORE.raw_defs[id]
         if isinstance(defn, ParsableDef):
             defn = defn.parse(Globals(DEF_STORE.frames[defn.id]), DEF_STORE.sources)
@@ -286,8 +310,8 @@ class CompilationEngine:
         """
         from guppylang_internals.checker.core import Globals
 
-        if (id, mono_args) in self.checked:
-            return self.checked[id, mono_args]
+        if (checked := self.checked.get((id, mono_args))) is not None:
+            return checked
         defn = self.get_parsed(id)
         if isinstance(defn, CheckableDef):
             defn = defn.check(Globals(DEF_STORE.frames[defn.id]))
@@ -324,11 +348,16 @@ class CompilationEngine:
 
         Adds the instantiation to the worklist and ensures that it will be checked.
         """
+        # Skip the bound-variable search if this instantiation is already enqueued or
+        # checked — common for generics that are used many times
+        key = defn.id, type_args
+        if key in self.to_check_worklist or key in self.checked:
+            return
         finder = BoundVarFinder()
         for arg in type_args:
             arg.visit(finder)
         if not finder.bound_vars:
-            self.to_check_worklist[defn.id, type_args] = defn
+            self.to_check_worklist[key] = defn
 
     def get_instance_func(self, ty: Type | TypeDef, name: str) -> CallableDef | None:
         """Looks up an instance function with a given name for a type.
@@ -369,11 +398,9 @@ class CompilationEngine:
                 return assert_never(ty)
 
         type_defn = cast("TypeDef", ENGINE.get_checked(type_defn.id, mono_args=()))
-        if (
-            type_defn.id in DEF_STORE.type_members
-            and name in DEF_STORE.type_members[type_defn.id]
-        ):
-            def_id = DEF_STORE.type_members[type_defn.id][name]
+        # Plain `get`s to avoid materialising an empty entry in the defaultdict
+        members = DEF_STORE.type_members.get(type_defn.id)
+        if members is not None and (def_id := members.get(name)) is not None:
             defn = ENGINE.get_parsed(def_id)
             if isinstance(defn, CallableDef):
                 return defn
@@ -553,7 +580,7 @@ class CompilationEngine:
         )
         # Package all non-standard extensions used in the hugr.
         # Standard hugr extensions are universally available and don't need bundling.
-        std_ext_names = hugr.std._std_extensions()
+        std_ext_names = self._get_std_extension_names()
         packaged_extensions = [
             ext
             for ext in used_extensions_result.used_extensions.extensions
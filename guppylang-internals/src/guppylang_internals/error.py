@@ -119,6 +119,11 @@ def saved_exception_hook() -> Iterator[None]:
 
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 
+#: Whether we're already executing inside a `pretty_errors`-decorated call. All
+#: decorated functions install the same hook, so nested calls (e.g. `get_parsed`
+#: invoked recursively under `check`) can skip the hook bookkeeping entirely.
+_pretty_errors_active = False
+
 
 def pretty_errors(f: FuncT) -> FuncT:
     """Decorator to print custom error banners when a `GuppyError` occurs."""
@@ -136,7 +141,14 @@ def pretty_errors(f: FuncT) -> FuncT:
 
     @functools.wraps(f)
     def pretty_errors_wrapped(*args: Any, **kwargs: Any) -> Any:
-        with exception_hook(hook):
+        global _pretty_errors_active
+        if _pretty_errors_active:
             return f(*args, **kwargs)
+        _pretty_errors_active = True
+        try:
+            with exception_hook(hook):
+                return f(*args, **kwargs)
+        finally:
+            _pretty_errors_active = False
 
     return cast("FuncT", pretty_errors_wrapped)
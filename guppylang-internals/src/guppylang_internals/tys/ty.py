@@ -895,7 +895,9 @@ class EnumType(ParametrizedTypeBase):
             EnumVariant(
                 variant.index,
                 variant.name,
-                [CheckedField(f.name, f.ty.transform(inst)) for f in variant.fields],
+                tuple(
+                    CheckedField(f.name, f.ty.transform(inst)) for f in variant.fields
+                ),
             )
             for variant in variants_list
         ]
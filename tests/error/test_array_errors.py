@@ -1,14 +1,9 @@
 import pathlib
 import pytest
 
-from tests.error.util import run_error_test
+from tests.error.util import collect_error_files, run_error_test
 
-path = pathlib.Path(__file__).parent.resolve() / "array_errors"
-files = [
-    x
-    for x in path.iterdir()
-    if x.is_file() and x.suffix == ".py" and x.name != "__init__.py"
-]
+files = collect_error_files(__file__, "array_errors")
 
 skipped_files = {
     "array_index_equal_size.py",
@@ -24,11 +19,10 @@ skipped_files = {
     "non_array_subscript.py",
 }
 
-# Turn paths into strings, otherwise pytest doesn't display the names
 files = [
-    pytest.param(str(f), marks=pytest.mark.skip(reason="The index bounds checking is currently disabled (https://github.com/Quantinuum/guppylang/issues/1669)."))
-    if f.name in skipped_files
-    else str(f)
+    pytest.param(f, marks=pytest.mark.skip(reason="The index bounds checking is currently disabled (https://github.com/Quantinuum/guppylang/issues/1669)."))
+    if pathlib.Path(f).name in skipped_files
+    else f
     for f in files
 ]
 
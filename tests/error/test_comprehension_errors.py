@@ -1,18 +1,9 @@
-import pathlib
 import pytest
 
-from tests.error.util import run_error_test
+from tests.error.util import collect_error_files, run_error_test
 from tests.conftest import experimental_features_enabled
 
-path = pathlib.Path(__file__).parent.resolve() / "comprehension_errors"
-files = [
-    x
-    for x in path.iterdir()
-    if x.is_file() and x.suffix == ".py" and x.name != "__init__.py"
-]
-
-# Turn paths into strings, otherwise pytest doesn't display the names
-files = [str(f) for f in files]
+files = collect_error_files(__file__, "comprehension_errors")
 
 
 @pytest.mark.parametrize("file", files)
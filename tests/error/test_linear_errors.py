@@ -1,21 +1,13 @@
 import pathlib
 import pytest
 
-from tests.error.util import run_error_test
+from tests.error.util import collect_error_files, run_error_test
 from tests.conftest import experimental_features_enabled
 
-path = pathlib.Path(__file__).parent.resolve() / "linear_errors"
-files = [
-    x
-    for x in path.iterdir()
-    if x.is_file() and x.suffix == ".py" and x.name != "__init__.py"
-]
+files = collect_error_files(__file__, "linear_errors")
 
 # TODO: Skip functional tests for now
-files = [f for f in files if "functional" not in f.name]
-
-# Turn paths into strings, otherwise pytest doesn't display the names
-files = [str(f) for f in files]
+files = [f for f in files if "functional" not in pathlib.Path(f).name]
 
 # Snapshot tests that require experimental features.
 tests_that_require_experimental_features = [
@@ -2,20 +2,12 @@ import pathlib
 import pytest
 
 from guppylang import guppy
-from tests.error.util import run_error_test
+from tests.error.util import collect_error_files, run_error_test
 
-path = pathlib.Path(__file__).parent.resolve() / "misc_errors"
-files = [
-    x
-    for x in path.iterdir()
-    if x.is_file() and x.suffix == ".py" and x.name != "__init__.py"
-]
+files = collect_error_files(__file__, "misc_errors")
 
 # TODO: Skip functional tests for now
-files = [f for f in files if "functional" not in f.name]
-
-# Turn paths into strings, otherwise pytest doesn't display the names
-files = [str(f) for f in files]
+files = [f for f in files if "functional" not in pathlib.Path(f).name]
 
 
 @pytest.mark.parametrize("file", files)
@@ -1,19 +1,10 @@
-import pathlib
 import pytest
 
 from guppylang_internals.tracing.state import reset_state
-from tests.error.util import run_error_test
+from tests.error.util import collect_error_files, run_error_test
 from tests.conftest import experimental_features_enabled
 
-path = pathlib.Path(__file__).parent.resolve() / "tracing_errors"
-files = [
-    x
-    for x in path.iterdir()
-    if x.is_file() and x.suffix == ".py" and x.name != "__init__.py"
-]
-
-# Turn paths into strings, otherwise pytest doesn't display the names
-files = [str(f) for f in files]
+files = collect_error_files(__file__, "tracing_errors")
 
 # Snapshot tests that require experimental features.
 tests_that_require_experimental_features = [
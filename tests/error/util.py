@@ -1,5 +1,6 @@
 import importlib.util
 import inspect
+import os
 import pathlib
 import re
 import sys
@@ -25,25 +26,60 @@ EXECNET_BOOTSTRAP = re.compile(
     r" *import sys;exec\(eval\(sys.stdin.readline\(\)\)\) *")
 
 
-def filter_traceback_not_containing(s: str, disallowed_regex: re.Pattern[str]) -> str:
-    result = []
-    traceback_started = False
-    for line in s.split("\n"):
-        if line.startswith("Traceback (most recent call last):"):
-            traceback_started = True
-        if traceback_started and disallowed_regex.fullmatch(line):
-            continue
+# Matches the line that marks the start of a Python traceback
+TRACEBACK_START = re.compile(r"^Traceback \(most recent call last\):", re.MULTILINE)
+
 
-        result.append(line)
+def filter_traceback_not_containing(s: str, disallowed_regex: re.Pattern[str]) -> str:
+    # Lines are only filtered once a traceback has started, so we run a single
+    # substitution on the tail instead of splitting the whole output into a list of
+    # lines. `re.compile` caches the derived pattern between calls.
+    start = TRACEBACK_START.search(s)
+    if start is None:
+        return s
+    # Consume the newline *before* the disallowed line, mirroring how the line and
+    # one separator would disappear when filtering a split-up list of lines. The
+    # first line of the tail is the traceback marker, which is never disallowed.
+    line = re.compile(rf"\n(?:{disallowed_regex.pattern})(?=\n|\Z)")
+    return s[: start.start()] + line.sub("", s[start.start():])
+
+def collect_error_files(test_file, dir_name):
+    """Lists the error files in the snapshot directory next to the given test driver.
+
+    Paths are returned as strings, otherwise pytest doesn't display the names.
+    `os.scandir` answers the file-type check from the directory entry itself instead
+    of paying a `stat` call per file during collection.
+    """
+    path = pathlib.Path(test_file).parent.resolve() / dir_name
+    with os.scandir(path) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".py")
+            and entry.name != "__init__.py"
+            and entry.is_file(follow_symlinks=False)
+        ]
 
-    return "\n".join(result)
 
 def run_error_test(file, capsys, snapshot, needs_experimental_features=False):
     file = pathlib.Path(file)
 
     def run_test():
-        with pytest.raises(Exception) as exc_info:
-            importlib.import_module(f"tests.error.{file.parent.name}.{file.stem}")
+        # Build the module spec straight from the known file path instead of going
+        # through `importlib.import_module`, which re-runs the whole sys.path finder
+        # chain (and its stat calls) for every test file
+        module_name = f"tests.error.{file.parent.name}.{file.stem}"
+        spec = importlib.util.spec_from_file_location(module_name, file)
+        module = importlib.util.module_from_spec(spec)
+        # Guppy looks up the source of definitions via sys.modules, so the module
+        # must be registered during execution. Drop it again afterwards, matching
+        # how a failed `import_module` leaves no entry behind.
+        sys.modules[module_name] = module
+        try:
+            with pytest.raises(Exception) as exc_info:
+                spec.loader.exec_module(module)
+        finally:
+            del sys.modules[module_name]
 
         # Remove the importlib frames from the traceback by skipping beginning frames until
         # we end up in the executed file
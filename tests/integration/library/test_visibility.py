@@ -1,4 +1,3 @@
-from hugr.ops import FuncDefn, FuncDecl
 from hugr.package import Package
 
 from guppylang import guppy
@@ -6,26 +5,17 @@ from guppylang import guppy
 import pytest
 
 from guppylang.library import GuppyLibrary
+from tests.util import iter_func_ops
 
 
 @pytest.fixture
 def qualifier(request) -> str:
     """Provides the common qualifier for functions defined in the current test."""
-
-    def tmp() -> None:
-        pass
-
-    return f"{tmp.__module__}.{request.node.originalname}"
+    return f"{request.module.__name__}.{request.node.originalname}"
 
 
 def _func_names_and_visibilities(package: Package) -> set[tuple[str, str]]:
-    hugr = package.modules[0]
-
-    return {
-        (n.op.f_name, n.op.visibility)
-        for n in hugr.values()
-        if isinstance(n.op, (FuncDefn, FuncDecl))
-    }
+    return {(op.f_name, op.visibility) for op in iter_func_ops(package)}
 
 
 def test_top_level_members_public(validate, qualifier):
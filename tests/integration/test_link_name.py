@@ -1,41 +1,25 @@
 import re
 
 import pytest
-from hugr.ops import FuncDefn, FuncDecl
 from hugr.package import Package
 
 from guppylang import guppy
 from guppylang.library import link_name
+from tests.util import func_names
 
 
 @pytest.fixture
 def qualifier(request) -> str:
     """Provides the common qualifier for functions defined in the current test."""
-
-    def tmp() -> None:
-        pass
-
-    return f"{tmp.__module__}.{request.node.originalname}"
-
-
-def _func_names(package: Package) -> set[str]:
-    hugr = package.modules[0]
-
-    return {
-        n.op.f_name for n in hugr.values() if isinstance(n.op, (FuncDefn, FuncDecl))
-    }
+    return f"{request.module.__name__}.{request.node.originalname}"
 
 
 def _func_names_excluding_main(package: Package, qualifier: str) -> set[str]:
-    func_names = _func_names(package)
-    try:
-        func_names.remove(f"{qualifier}.<locals>.main")
-    except KeyError:
-        raise AssertionError(
-            f"Main function name `{qualifier}.<locals>.main` not found in package."
-        )
-
-    return func_names
+    names = func_names(package)
+    main_name = f"{qualifier}.<locals>.main"
+    assert main_name in names, f"Main function name `{main_name}` not found in package."
+    names.discard(main_name)
+    return names
 
 
 def test_func_link_name_annotated():
@@ -50,8 +34,8 @@ def test_func_link_name_annotated():
     @link_name("some.other.qualified.name")
     def main_dec() -> None: ...
 
-    assert _func_names(main_def.compile()) == {"some.qualified.name"}
-    assert _func_names(main_dec.compile()) == {"some.other.qualified.name"}
+    assert func_names(main_def.compile()) == {"some.qualified.name"}
+    assert func_names(main_dec.compile()) == {"some.other.qualified.name"}
 
 
 def test_func_link_name_inferred(qualifier):
@@ -64,8 +48,8 @@ def test_func_link_name_inferred(qualifier):
     @guppy.declare
     def crazy_dec() -> None: ...
 
-    assert _func_names(crazy_def.compile()) == {f"{qualifier}.<locals>.crazy_def"}
-    assert _func_names(crazy_dec.compile()) == {f"{qualifier}.<locals>.crazy_dec"}
+    assert func_names(crazy_def.compile()) == {f"{qualifier}.<locals>.crazy_def"}
+    assert func_names(crazy_dec.compile()) == {f"{qualifier}.<locals>.crazy_dec"}
 
 
 def test_struct_member_link_name_annotated(qualifier):
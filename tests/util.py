@@ -4,12 +4,31 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from guppylang.decorator import custom_guppy_decorator, guppy
+from hugr.ops import FuncDecl, FuncDefn
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from guppylang.defs import GuppyFunctionDefinition
     from hugr.package import Package, PackagePointer
 
 
+# Hoisted so the tuple isn't rebuilt for every node visited by `iter_func_ops`
+_FUNC_OPS = (FuncDefn, FuncDecl)
+
+
+def iter_func_ops(package: Package) -> Iterator[FuncDefn | FuncDecl]:
+    """Iterates over the function definition and declaration ops in a package's main
+    module."""
+    hugr = package.modules[0]
+    return (n.op for n in hugr.values() if isinstance(n.op, _FUNC_OPS))
+
+
+def func_names(package: Package) -> set[str]:
+    """The names of all functions defined or declared in a package's main module."""
+    return {op.f_name for op in iter_func_ops(package)}
+
+
 @custom_guppy_decorator
 def compile_guppy(fn) -> Package:
     """A decorator that combines @guppy with HUGR compilation."""